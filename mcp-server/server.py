@@ -19,28 +19,55 @@ License: MIT
 """
 
 import os
+import time
 import asyncio
+import functools
 import logging
+import operator
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Literal, Union
+from typing import (
+    List, Dict, Any, NamedTuple, Optional, Literal, Set, Tuple, Union, overload,
+)
 from dataclasses import dataclass, field
-from pydantic import BaseModel, Field, validator
-from google.genai import Client
+from pydantic import BaseModel, ConfigDict, Field
+import httpx
+from google.genai import Client, types as genai_types
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import AIMessage, HumanMessage
 from dotenv import load_dotenv
-import json
 import re
-from urllib.parse import urlparse
-import hashlib
+
+from server_cache import SEMANTIC_CACHE_AVAILABLE, ExactCache, SemanticCache, cached_llm
+from server_utils import (
+    canonicalize_query,
+    generate_session_id,
+    get_current_date,
+    validate_urls,
+)
+from server_utils import validate_url  # noqa: F401 - re-exported for existing importers
 
 try:
-    from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp import Context, FastMCP
 except ImportError:
     raise ImportError(
         "FastMCP is required. Install with: pip install mcp"
     )
 
+# HTTP/2 lets concurrent searches multiplex over one connection; it needs the h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# uvloop's libuv-based event loop cuts scheduling overhead for the many small
+# awaitables a research run fans out; it is not available on Windows
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -65,58 +92,199 @@ RESEARCH_MODEL = "gemini-2.5-flash-preview-05-20"
 QUERY_MODEL = "gemini-2.0-flash"  # For query generation
 REFLECTION_MODEL = "gemini-2.5-flash-preview-04-17"  # For reflection
 ANSWER_MODEL = "gemini-2.5-pro-preview-05-06"  # For final answer
+SUMMARY_MODEL = "gemini-2.0-flash"  # For condensing batches of findings before the final answer
+
 
 # Effort tier configurations with clear limits
-EFFORT_TIERS = {
-    "low": {
-        "max_searches": 10,
-        "max_research_loops": 1,
-        "initial_queries": 2,
-        "description": "Quick research with up to 10 searches and 1 research loop"
-    },
-    "medium": {
-        "max_searches": 100,
-        "max_research_loops": 3,
-        "initial_queries": 4,
-        "description": "Balanced research with up to 100 searches and 3 research loops"
-    },
-    "high": {
-        "max_searches": 1000,
-        "max_research_loops": 5,
-        "initial_queries": 6,
-        "description": "Comprehensive research with up to 1000 searches and 5 research loops"
-    }
+class EffortTier(NamedTuple):
+    """Search budget and loop limits for one research effort level."""
+    max_searches: int
+    max_research_loops: int
+    initial_queries: int
+    description: str
+
+
+EFFORT_TIERS: Dict[str, EffortTier] = {
+    "low": EffortTier(
+        max_searches=10,
+        max_research_loops=1,
+        initial_queries=2,
+        description="Quick research with up to 10 searches and 1 research loop"
+    ),
+    "medium": EffortTier(
+        max_searches=100,
+        max_research_loops=3,
+        initial_queries=4,
+        description="Balanced research with up to 100 searches and 3 research loops"
+    ),
+    "high": EffortTier(
+        max_searches=1000,
+        max_research_loops=5,
+        initial_queries=6,
+        description="Comprehensive research with up to 1000 searches and 5 research loops"
+    )
 }
 
+# Precompiled pattern for normalizing citation title whitespace
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# C-level getter for the grounding chunk fields read for every citation
+_get_web_fields = operator.attrgetter('web', 'web.uri', 'web.title')
+_MISSING_WEB_FIELDS = (None, None, None)
+
+# Prompt templates, filled in with str.format at call time
+QUERY_PROMPT_TEMPLATE = """You are a research query specialist. Generate {num_queries} sophisticated and diverse web search queries for comprehensive research on: {research_topic}
+
+Current date: {current_date}
+
+Instructions:
+- Create queries that explore different aspects and perspectives of the topic
+- Ensure queries are specific enough to find relevant, authoritative sources
+- Include queries for recent developments, expert opinions, and factual data
+- Avoid duplicate or overly similar queries
+- Each query should have a clear rationale explaining its purpose
+{context}
+
+Format your response as a JSON object with:
+- queries: array of objects with 'query' and 'rationale' fields
+- rationale: overall explanation for the query selection strategy
+
+Topic: {research_topic}"""
+
+SEARCH_PROMPT_TEMPLATE = """Conduct a comprehensive Google Search on "{query}" and provide a detailed, well-structured summary.
+
+Instructions:
+- Current date: {current_date}
+- Search for the most recent, credible, and authoritative information
+- Provide a comprehensive summary with key findings, facts, and insights
+- Structure your response with clear sections and bullet points where appropriate
+- Focus on factual information from reliable sources
+- Include relevant statistics, expert opinions, and recent developments
+- Only include information that can be verified from search results
+
+Search Query: {query}"""
+
+REFLECTION_PROMPT_TEMPLATE = """Analyze the current research progress and determine if we have sufficient information or need additional research.
+
+Research Topic: {research_topic}
+Research Effort Level: {effort_level} ({effort_context})
+Current Date: {current_date}
+
+Current Research Findings:
+{findings_summary}
+
+Please evaluate:
+1. Are the current findings comprehensive enough to answer the research topic?
+2. What specific knowledge gaps or areas need more investigation?
+3. What follow-up queries would address these gaps most effectively? \
+Write each one as a concise, self-contained web search query, since they are searched as-is
+4. Rate your confidence in the current research completeness (0-1 scale)
+
+Provide your analysis in the specified JSON format."""
+
+ANSWER_PROMPT_TEMPLATE = """Based on the comprehensive research conducted, provide a detailed, well-structured answer to the research topic.
+
+Research Topic: {research_topic}
+Research Effort: {effort_level} ({effort_context})
+Current Date: {current_date}
+Total Research Queries: {num_results}
+
+Research Content:
+{research_content}
+
+Instructions:
+- Synthesize all research findings into a comprehensive, coherent answer
+- Structure your response with clear headings and sections
+- Include key facts, statistics, expert opinions, and recent developments
+- Maintain objectivity and cite multiple perspectives where relevant
+- Ensure accuracy and avoid speculation beyond the research findings
+- Provide actionable insights or conclusions where appropriate
+- Keep the response informative yet accessible
+
+Generate a comprehensive research report that fully addresses the topic."""
+
+SUMMARY_PROMPT_TEMPLATE = """Condense the following research findings on "{research_topic}" \
+into a concise, information-dense summary.
+
+Instructions:
+- Preserve key facts, statistics, dates, and expert opinions
+- Keep citation markers such as [3-1] next to the facts they support
+- Remove repetition and filler
+
+Research Findings:
+{findings}"""
+
+# Results per summarization batch; larger result sets are condensed before the final answer
+SUMMARY_BATCH_SIZE = 10
+SUMMARY_MAX_OUTPUT_TOKENS = 2048  # Keeps each condensed batch, and so the final prompt, bounded
+
+# Cap on in-flight Google Search requests so gathered searches stay under API rate limits
+MAX_CONCURRENT_SEARCHES = int(os.getenv("MAX_CONCURRENT_SEARCHES", "5"))
+_search_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+_summary_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+# Maximum topics per research_topics_batch call and how many are researched at once
+MAX_BATCH_TOPICS = 10
+MAX_CONCURRENT_TOPICS = int(os.getenv("MAX_CONCURRENT_TOPICS", "3"))
+
+# Response cache sizes (entries) for repeated searches and query generation
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "128"))
+SEMANTIC_CACHE_ENABLED = (
+    os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+)
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.93"))
+
+# Shared connection pool for Google Search requests, closed when the server shuts down
+REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "30"))
+_http_client = httpx.AsyncClient(
+    http2=HTTP2_AVAILABLE,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=REQUEST_TIMEOUT,
+)
+
 # Initialize Google GenAI client with error handling
 try:
-    genai_client = Client(api_key=GEMINI_API_KEY)
+    # google-genai sends its own per-request timeout (None unless set here), which
+    # overrides the httpx client default, so the timeout is passed in milliseconds
+    _genai_timeout_ms = int(REQUEST_TIMEOUT * 1000)
+    # Older google-genai releases cannot take a caller-provided httpx client
+    if "httpx_async_client" in genai_types.HttpOptions.model_fields:
+        genai_client = Client(
+            api_key=GEMINI_API_KEY,
+            http_options=genai_types.HttpOptions(
+                timeout=_genai_timeout_ms,
+                httpx_async_client=_http_client,
+            ),
+        )
+    else:
+        genai_client = Client(
+            api_key=GEMINI_API_KEY,
+            http_options=genai_types.HttpOptions(timeout=_genai_timeout_ms),
+        )
     logger.info("Successfully initialized Google GenAI client")
 except Exception as e:
-    logger.error(f"Failed to initialize Google GenAI client: {e}")
+    logger.error("Failed to initialize Google GenAI client: %s", e)
     raise
 
 
-# Pydantic models for structured data
+# Pydantic models for structured LLM output; langchain's with_structured_output
+# builds the response schema from these and pydantic-core validates replies
 class SearchQuery(BaseModel):
     """Individual search query with rationale and metadata."""
+    # Whitespace is stripped by pydantic-core before the length checks run
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     query: str = Field(description="The search query string", min_length=1, max_length=500)
     rationale: str = Field(description="Explanation for this query", min_length=1)
-    
-    @validator('query')
-    def validate_query(cls, v):
-        """Ensure query is not empty and reasonable length."""
-        if not v.strip():
-            raise ValueError("Query cannot be empty")
-        return v.strip()
 
 
 class SearchQueryList(BaseModel):
     """List of search queries with overall rationale."""
     queries: List[SearchQuery] = Field(
         description="List of search queries", 
-        min_items=1, 
-        max_items=10
+        min_length=1, 
+        max_length=10
     )
     rationale: str = Field(description="Overall rationale for these queries")
 
@@ -126,8 +294,8 @@ class ResearchReflection(BaseModel):
     is_sufficient: bool = Field(description="Whether current research is sufficient")
     knowledge_gap: str = Field(description="Description of remaining information gaps")
     follow_up_queries: List[str] = Field(
-        description="Suggested follow-up queries",
-        max_items=5
+        description="Follow-up web search queries, each ready to search as-is",
+        max_length=5
     )
     confidence_score: float = Field(
         description="Confidence in current research (0-1)",
@@ -137,24 +305,83 @@ class ResearchReflection(BaseModel):
     )
 
 
-class CitationSegment(BaseModel):
+# Internal records are slotted dataclasses: they are built in bulk from already
+# validated data, so they skip pydantic validation and per-instance __dict__s.
+
+
+@dataclass(frozen=True, slots=True)
+class CitationSegment:
     """Individual citation segment with metadata."""
-    url: str = Field(description="Original URL")
-    short_url: str = Field(description="Shortened URL for display")
-    title: str = Field(description="Source title")
-    snippet: Optional[str] = Field(description="Content snippet", default=None)
+    url: str  # Original URL
+    short_url: str  # Shortened URL for display
+    title: str  # Source title
+    snippet: Optional[str] = None  # Content snippet
 
 
-class SearchResult(BaseModel):
+@dataclass(slots=True)
+class CitationBlock:
+    """A search's citations stored as parallel field lists (struct of arrays).
+    
+    Indexing or iterating yields CitationSegment views, so a block can be used
+    wherever a list of segments is expected.
+    """
+    urls: List[str] = field(default_factory=list)
+    short_urls: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    snippets: List[Optional[str]] = field(default_factory=list)
+    
+    @classmethod
+    def from_segments(cls, segments: List[CitationSegment]) -> "CitationBlock":
+        """Build a block from individual citation segments."""
+        block = cls()
+        for segment in segments:
+            block.append(segment.url, segment.short_url, segment.title, segment.snippet)
+        return block
+    
+    def append(self, url: str, short_url: str, title: str, snippet: Optional[str] = None) -> None:
+        """Add one citation to the end of the block."""
+        self.urls.append(url)
+        self.short_urls.append(short_url)
+        self.titles.append(title)
+        self.snippets.append(snippet)
+    
+    def __len__(self) -> int:
+        return len(self.urls)
+    
+    @overload
+    def __getitem__(self, index: int) -> CitationSegment: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> "CitationBlock": ...
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[CitationSegment, "CitationBlock"]:
+        if isinstance(index, slice):
+            return CitationBlock(
+                self.urls[index], self.short_urls[index], self.titles[index], self.snippets[index]
+            )
+        if not isinstance(index, int):
+            raise TypeError(
+                f"CitationBlock indices must be integers or slices, not {type(index).__name__}"
+            )
+        return CitationSegment(
+            self.urls[index], self.short_urls[index], self.titles[index], self.snippets[index]
+        )
+    
+    def __iter__(self):
+        return map(CitationSegment, self.urls, self.short_urls, self.titles, self.snippets)
+
+
+@dataclass(slots=True)
+class SearchResult:
     """Individual search result with comprehensive metadata."""
-    content: str = Field(description="Research content with citations")
-    citations: List[CitationSegment] = Field(description="Source citations")
-    query_used: str = Field(description="Original search query")
-    timestamp: datetime = Field(default_factory=datetime.now)
-    search_id: int = Field(description="Unique search identifier")
+    content: str  # Research content with citations
+    citations: CitationBlock  # Source citations
+    query_used: str  # Original search query
+    search_id: int  # Unique search identifier
+    timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchState:
     """Current state of research process with comprehensive tracking."""
     topic: str
@@ -162,19 +389,20 @@ class ResearchState:
     search_count: int = 0
     loop_count: int = 0
     results: List[SearchResult] = field(default_factory=list)
-    all_citations: List[CitationSegment] = field(default_factory=list)
     is_complete: bool = False
-    start_time: datetime = field(default_factory=datetime.now)
+    # Canonical forms of dispatched queries
+    completed_queries: Set[str] = field(default_factory=set)
+    start_monotonic: float = field(default_factory=time.monotonic)  # For elapsed time only
     
     @property
     def max_searches(self) -> int:
         """Get maximum searches allowed for current effort level."""
-        return EFFORT_TIERS[self.effort_level]["max_searches"]
+        return EFFORT_TIERS[self.effort_level].max_searches
     
     @property
     def max_loops(self) -> int:
         """Get maximum research loops allowed for current effort level."""
-        return EFFORT_TIERS[self.effort_level]["max_research_loops"]
+        return EFFORT_TIERS[self.effort_level].max_research_loops
     
     @property
     def searches_remaining(self) -> int:
@@ -191,75 +419,174 @@ class ResearchState:
         )
 
 
-# Initialize FastMCP server with proper configuration
-mcp = FastMCP(
-    name="Gemini Research Agent",
-    version="1.0.0"
-)
+# Caches keyed on the current date so results never outlive the day they were fetched
+_search_cache = ExactCache(SEARCH_CACHE_SIZE)
+_query_cache = ExactCache(QUERY_CACHE_SIZE)
+_reflection_cache = ExactCache(QUERY_CACHE_SIZE)
 
-# Global research state tracking
-active_research_sessions: Dict[str, ResearchState] = {}
+# Optional second tier that reuses query lists generated for near-identical topics
+_semantic_query_cache: Optional[SemanticCache] = None
+if SEMANTIC_CACHE_ENABLED:
+    if SEMANTIC_CACHE_AVAILABLE:
+        _semantic_query_cache = SemanticCache(
+            maxsize=QUERY_CACHE_SIZE, threshold=SEMANTIC_CACHE_THRESHOLD
+        )
+    else:
+        logger.warning(
+            "SEMANTIC_CACHE_ENABLED is set but faiss/sentence-transformers are not installed; "
+            "using exact-match caching only"
+        )
 
+# Searches currently awaiting a response, keyed like _search_cache
+_inflight_searches: Dict[Any, "asyncio.Future[Tuple[str, List[Any]]]"] = {}
+
+
+# Shared LLM clients, built on first use and reused so HTTP connections stay warm
+@functools.cache
+def _get_llm(
+    model: str,
+    temperature: float,
+    schema: Optional[type] = None,
+    max_output_tokens: Optional[int] = None
+) -> Any:
+    """Return a shared chat model, optionally bound to a structured output schema."""
+    if schema is not None:
+        return _get_llm(
+            model, temperature, max_output_tokens=max_output_tokens
+        ).with_structured_output(schema)
+    llm_kwargs: Dict[str, Any] = {}
+    if max_output_tokens is not None:
+        llm_kwargs["max_output_tokens"] = max_output_tokens
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        max_retries=3,
+        api_key=GEMINI_API_KEY,
+        **llm_kwargs,
+    )
 
-def get_current_date() -> str:
-    """Get current date in human-readable format."""
-    return datetime.now().strftime("%B %d, %Y")
 
+async def close_http_client() -> None:
+    """Release the shared HTTP connection pool once, at process exit.
+    
+    This is deliberately not a FastMCP lifespan: the lifespan is entered per
+    client session (once per SSE connection), and closing the module-level
+    client there would break searches for every other session.
+    """
+    await _http_client.aclose()
 
-def generate_session_id(topic: str, effort_level: str) -> str:
-    """Generate unique session ID for research tracking."""
-    content = f"{topic}_{effort_level}_{datetime.now().isoformat()}"
-    return hashlib.md5(content.encode()).hexdigest()[:12]
 
+# Initialize FastMCP server with proper configuration
+mcp = FastMCP(
+    name="Gemini Research Agent",
+    version="1.0.0"
+)
 
-def validate_url(url: str) -> bool:
-    """Validate if URL is properly formatted."""
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+# Global research state tracking; conduct_research removes each session in a finally
+# block, so this only ever holds runs that are still in flight
+active_research_sessions: Dict[str, ResearchState] = {}
 
 
-def resolve_urls(grounding_chunks: List[Any], search_id: int) -> List[CitationSegment]:
-    """Process and resolve URLs from grounding chunks with validation."""
-    citations = []
+def resolve_urls(grounding_chunks: List[Any], search_id: int) -> CitationBlock:
+    """Process and resolve URLs from grounding chunks with validation.
     
-    for i, chunk in enumerate(grounding_chunks):
+    Chunks without a web source or with a non-HTTP(S) URI are skipped.
+    """
+    citations = CitationBlock()
+    fields = []
+    for chunk in grounding_chunks:
         try:
-            if hasattr(chunk, 'web') and chunk.web and hasattr(chunk.web, 'uri'):
-                url = chunk.web.uri
-                if validate_url(url):
-                    title = getattr(chunk.web, 'title', 'Unknown Source')
-                    # Clean and truncate title
-                    title = re.sub(r'\s+', ' ', title).strip()
-                    if len(title) > 100:
-                        title = title[:97] + "..."
-                    
-                    citations.append(CitationSegment(
-                        url=url,
-                        short_url=f"[{search_id}-{i}]",
-                        title=title,
-                        snippet=getattr(chunk.web, 'snippet', None)
-                    ))
-        except Exception as e:
-            logger.warning(f"Error processing grounding chunk {i}: {e}")
+            fields.append(_get_web_fields(chunk))
+        except AttributeError:
+            # No web source, or one missing the expected attributes
+            fields.append(_MISSING_WEB_FIELDS)
+    valid = validate_urls([url for _, url, _ in fields], web_only=True)
+    
+    for i, ((web, url, title), is_valid) in enumerate(zip(fields, valid)):
+        if not is_valid:
             continue
+        
+        # Clean and truncate title
+        title = _WHITESPACE_RE.sub(' ', title).strip() if isinstance(title, str) else ""
+        if not title:
+            title = "Unknown Source"
+        elif len(title) > 100:
+            title = title[:97] + "..."
+        
+        snippet = getattr(web, 'snippet', None)
+        citations.append(
+            url, f"[{search_id}-{i}]", title, snippet if isinstance(snippet, str) else None
+        )
     
     return citations
 
 
-def insert_citation_markers(text: str, citations: List[CitationSegment]) -> str:
+def insert_citation_markers(text: str, citations: CitationBlock) -> str:
     """Insert citation markers into text with improved formatting."""
     if not citations:
         return text
     
-    # Add citations at the end of sentences or paragraphs
-    citation_text = "\n\n**Sources:**\n"
-    for citation in citations:
-        citation_text += f"- {citation.short_url} [{citation.title}]({citation.url})\n"
-    
-    return text + citation_text
+    # Build the sources block in one join over the parallel field lists
+    return "".join([
+        text,
+        "\n\n**Sources:**\n",
+        *[
+            f"- {short_url} [{title}]({url})\n"
+            for short_url, title, url in zip(citations.short_urls, citations.titles, citations.urls)
+        ],
+    ])
+
+
+def failed_search_result(query: str, search_id: int, error: BaseException) -> SearchResult:
+    """Build the placeholder result recorded for a search that could not be completed."""
+    return SearchResult(
+        content=f"Search failed for query: {query}. Error: {str(error)}",
+        citations=CitationBlock(),
+        query_used=query,
+        search_id=search_id
+    )
+
+
+def build_search_result(
+    query: str,
+    search_id: int,
+    content: str,
+    grounding_chunks: List[Any]
+) -> SearchResult:
+    """Assemble a SearchResult, numbering citations with the given search ID."""
+    citations = resolve_urls(grounding_chunks, search_id)
+    return SearchResult(
+        content=insert_citation_markers(content, citations),
+        citations=citations,
+        query_used=query,
+        search_id=search_id
+    )
+
+
+@cached_llm(
+    # Only context-free generations are reusable across sessions
+    key_fn=lambda topic, num_queries, context: (
+        None if context else (topic, num_queries, get_current_date())
+    ),
+    cache=_query_cache,
+    semantic_cache=_semantic_query_cache,
+    semantic_key_fn=lambda topic, num_queries, context: (
+        None if context else (topic, (num_queries, get_current_date()))
+    ),
+)
+async def _generate_queries_with_llm(
+    research_topic: str, num_queries: int, context: str
+) -> SearchQueryList:
+    """Ask the query model for search queries; errors propagate uncached."""
+    prompt = QUERY_PROMPT_TEMPLATE.format(
+        num_queries=num_queries,
+        research_topic=research_topic,
+        current_date=get_current_date(),
+        context=context,
+    )
+    # Slightly creative temperature for query diversity
+    structured_llm = _get_llm(QUERY_MODEL, 0.7, SearchQueryList)
+    return await structured_llm.ainvoke(prompt)
 
 
 async def generate_search_queries(
@@ -277,40 +604,16 @@ async def generate_search_queries(
             context += f"- Query: {result.query_used}\n"
             context += f"  Key findings: {result.content[:200]}...\n"
     
-    prompt = f"""You are a research query specialist. Generate {num_queries} sophisticated and diverse web search queries for comprehensive research on: {research_topic}
-
-Current date: {get_current_date()}
-
-Instructions:
-- Create queries that explore different aspects and perspectives of the topic
-- Ensure queries are specific enough to find relevant, authoritative sources
-- Include queries for recent developments, expert opinions, and factual data
-- Avoid duplicate or overly similar queries
-- Each query should have a clear rationale explaining its purpose
-{context}
-
-Format your response as a JSON object with:
-- queries: array of objects with 'query' and 'rationale' fields
-- rationale: overall explanation for the query selection strategy
-
-Topic: {research_topic}"""
-
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=QUERY_MODEL,
-            temperature=0.7,  # Slightly creative for query diversity
-            max_retries=3,
-            api_key=GEMINI_API_KEY,
-        )
+        result = await _generate_queries_with_llm(research_topic, num_queries, context)
         
-        structured_llm = llm.with_structured_output(SearchQueryList)
-        result = structured_llm.invoke(prompt)
-        
-        logger.info(f"Generated {len(result.queries)} search queries for topic: {research_topic}")
+        logger.info(
+            "Generated %s search queries for topic: %s", len(result.queries), research_topic
+        )
         return result
         
     except Exception as e:
-        logger.error(f"Error generating search queries: {e}")
+        logger.error("Error generating search queries: %s", e)
         # Fallback to simple queries
         fallback_queries = [
             SearchQuery(query=research_topic, rationale="Direct topic search"),
@@ -322,74 +625,118 @@ Topic: {research_topic}"""
         )
 
 
-async def perform_web_search(
-    query: str, 
-    search_id: int,
-    max_retries: int = 3
-) -> SearchResult:
-    """Perform web search using Google Search API with comprehensive error handling."""
-    
-    prompt = f"""Conduct a comprehensive Google Search on "{query}" and provide a detailed, well-structured summary.
+def extract_grounding_chunks(response: Any) -> List[Any]:
+    """Return the grounding chunks of a response or stream chunk, if any."""
+    candidates = getattr(response, 'candidates', None)
+    if not candidates:
+        return []
+    grounding_metadata = getattr(candidates[0], 'grounding_metadata', None)
+    return getattr(grounding_metadata, 'grounding_chunks', None) or []
 
-Instructions:
-- Current date: {get_current_date()}
-- Search for the most recent, credible, and authoritative information
-- Provide a comprehensive summary with key findings, facts, and insights
-- Structure your response with clear sections and bullet points where appropriate
-- Focus on factual information from reliable sources
-- Include relevant statistics, expert opinions, and recent developments
-- Only include information that can be verified from search results
 
-Search Query: {query}"""
+async def fetch_search_response(query: str, max_retries: int = 3) -> Tuple[str, List[Any]]:
+    """Run a grounded Google Search, retrying with exponential backoff.
+    
+    The response is streamed. Returns the accumulated text (empty if none) and
+    its grounding chunks, and re-raises the last error once every attempt has
+    failed.
+    """
+    
+    prompt = SEARCH_PROMPT_TEMPLATE.format(query=query, current_date=get_current_date())
 
     for attempt in range(max_retries):
         try:
-            response = genai_client.models.generate_content(
-                model=RESEARCH_MODEL,
-                contents=prompt,
-                config={
-                    "tools": [{"google_search": {}}],
-                    "temperature": 0.1,  # Low temperature for factual accuracy
-                },
-            )
-            
-            # Process grounding metadata for citations
-            citations = []
-            
-            if (hasattr(response, 'candidates') and 
-                response.candidates and 
-                hasattr(response.candidates[0], 'grounding_metadata') and
-                response.candidates[0].grounding_metadata and
-                hasattr(response.candidates[0].grounding_metadata, 'grounding_chunks')):
-                
-                grounding_chunks = response.candidates[0].grounding_metadata.grounding_chunks
-                citations = resolve_urls(grounding_chunks, search_id)
+            content_parts: List[str] = []
+            grounding_chunks: List[Any] = []
             
-            # Format content with citations
-            content = response.text if response.text else "No content retrieved"
-            formatted_content = insert_citation_markers(content, citations)
-            
-            search_result = SearchResult(
-                content=formatted_content,
-                citations=citations,
-                query_used=query,
-                search_id=search_id
-            )
+            # Only the request itself holds a slot; backoff sleeps happen outside it
+            async with _search_semaphore:
+                stream = await genai_client.aio.models.generate_content_stream(
+                    model=RESEARCH_MODEL,
+                    contents=prompt,
+                    config={
+                        "tools": [{"google_search": {}}],
+                        "temperature": 0.1,  # Low temperature for factual accuracy
+                    },
+                )
+                # Collect text and grounding metadata as chunks arrive
+                async for chunk in stream:
+                    if chunk.text:
+                        content_parts.append(chunk.text)
+                    grounding_chunks.extend(extract_grounding_chunks(chunk))
             
-            logger.info(f"Successfully completed search {search_id} for query: {query}")
-            return search_result
+            return "".join(content_parts), grounding_chunks
             
         except Exception as e:
-            logger.warning(f"Search attempt {attempt + 1} failed for query '{query}': {e}")
+            logger.warning("Search attempt %s failed for query '%s': %s", attempt + 1, query, e)
             if attempt == max_retries - 1:
-                # Final fallback
-                return SearchResult(
-                    content=f"Search failed for query: {query}. Error: {str(e)}",
-                    citations=[],
-                    query_used=query,
-                    search_id=search_id
-                )
+                raise
             await asyncio.sleep(2 ** attempt)  # Exponential backoff
+    
+    # Only reachable when no attempt was made at all
+    raise ValueError(f"max_retries must be at least 1, got {max_retries}")
+
+
+async def perform_web_search(
+    query: str, 
+    search_id: int,
+    max_retries: int = 3
+) -> SearchResult:
+    """Perform web search using Google Search API with comprehensive error handling."""
+    
+    cache_key = (query, get_current_date())
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        content, grounding_chunks = cached
+        logger.info("Using cached result for search %s, query: %s", search_id, query)
+        return build_search_result(query, search_id, content, grounding_chunks)
+    
+    # Identical searches already in flight (e.g. from overlapping sessions) share one request
+    fetch = _inflight_searches.get(cache_key)
+    if fetch is None:
+        fetch = asyncio.ensure_future(fetch_search_response(query, max_retries))
+        _inflight_searches[cache_key] = fetch
+        fetch.add_done_callback(lambda _: _inflight_searches.pop(cache_key, None))
+    
+    try:
+        # Shielded so one cancelled caller does not abort the search for the others
+        text, grounding_chunks = await asyncio.shield(fetch)
+    except Exception as e:
+        # Final fallback
+        return failed_search_result(query, search_id, e)
+    
+    # Cache the raw response; citation numbering depends on the caller's search ID
+    if text:
+        _search_cache.set(cache_key, (text, grounding_chunks))
+    
+    search_result = build_search_result(
+        query, search_id, text or "No content retrieved", grounding_chunks
+    )
+    
+    logger.info("Successfully completed search %s for query: %s", search_id, query)
+    return search_result
+
+
+@cached_llm(
+    # The prompt is fully determined by these inputs, so identical findings reuse the verdict
+    key_fn=lambda topic, effort_level, findings_summary: (
+        topic, effort_level, findings_summary, get_current_date()
+    ),
+    cache=_reflection_cache,
+)
+async def _reflect_with_llm(
+    research_topic: str, effort_level: str, findings_summary: str
+) -> ResearchReflection:
+    """Ask the reflection model to assess findings; errors propagate uncached."""
+    prompt = REFLECTION_PROMPT_TEMPLATE.format(
+        research_topic=research_topic,
+        effort_level=effort_level,
+        effort_context=EFFORT_TIERS[effort_level].description,
+        current_date=get_current_date(),
+        findings_summary=findings_summary,
+    )
+    structured_llm = _get_llm(REFLECTION_MODEL, 0.3, ResearchReflection)
+    return await structured_llm.ainvoke(prompt)
 
 
 async def reflect_on_research(
@@ -399,8 +746,9 @@ async def reflect_on_research(
 ) -> ResearchReflection:
     """Analyze research progress and identify knowledge gaps."""
     
+    # Fallbacks below are built from known-valid constants, so they skip validation
     if not current_results:
-        return ResearchReflection(
+        return ResearchReflection.model_construct(
             is_sufficient=False,
             knowledge_gap="No research results available yet",
             follow_up_queries=[research_topic],
@@ -413,43 +761,16 @@ async def reflect_on_research(
         for result in current_results[-5:]  # Last 5 results
     ])
     
-    effort_context = EFFORT_TIERS[effort_level]["description"]
-    
-    prompt = f"""Analyze the current research progress and determine if we have sufficient information or need additional research.
-
-Research Topic: {research_topic}
-Research Effort Level: {effort_level} ({effort_context})
-Current Date: {get_current_date()}
-
-Current Research Findings:
-{findings_summary}
-
-Please evaluate:
-1. Are the current findings comprehensive enough to answer the research topic?
-2. What specific knowledge gaps or areas need more investigation?
-3. What follow-up queries would address these gaps most effectively?
-4. Rate your confidence in the current research completeness (0-1 scale)
-
-Provide your analysis in the specified JSON format."""
-
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=REFLECTION_MODEL,
-            temperature=0.3,
-            max_retries=3,
-            api_key=GEMINI_API_KEY,
-        )
-        
-        structured_llm = llm.with_structured_output(ResearchReflection)
-        result = structured_llm.invoke(prompt)
+        result = await _reflect_with_llm(research_topic, effort_level, findings_summary)
         
-        logger.info(f"Research reflection completed. Sufficient: {result.is_sufficient}, Confidence: {result.confidence_score}")
+        logger.info("Research reflection completed. Sufficient: %s, Confidence: %s", result.is_sufficient, result.confidence_score)
         return result
         
     except Exception as e:
-        logger.error(f"Error in research reflection: {e}")
+        logger.error("Error in research reflection: %s", e)
         # Conservative fallback
-        return ResearchReflection(
+        return ResearchReflection.model_construct(
             is_sufficient=len(current_results) >= 3,  # Simple heuristic
             knowledge_gap="Unable to analyze research completeness due to processing error",
             follow_up_queries=[f"{research_topic} additional information"],
@@ -457,64 +778,86 @@ Provide your analysis in the specified JSON format."""
         )
 
 
+def format_research_content(results: List[SearchResult]) -> str:
+    """Format search results as a prompt-ready block of queries and findings."""
+    return "\n\n".join(
+        f"Research Query: {result.query_used}\n{result.content}"
+        for result in results
+    )
+
+
+async def summarize_research_batch(research_topic: str, results: List[SearchResult]) -> str:
+    """Condense a batch of search results, falling back to the raw findings on error."""
+    
+    findings = format_research_content(results)
+    prompt = SUMMARY_PROMPT_TEMPLATE.format(research_topic=research_topic, findings=findings)
+    
+    try:
+        llm = _get_llm(SUMMARY_MODEL, 0.2, max_output_tokens=SUMMARY_MAX_OUTPUT_TOKENS)
+        async with _summary_semaphore:
+            response = await llm.ainvoke(prompt)
+        return response.content
+        
+    except Exception as e:
+        logger.warning("Error summarizing research batch, using raw findings: %s", e)
+        return findings
+
+
 async def finalize_research_answer(
     research_topic: str,
     results: List[SearchResult],
-    effort_level: str
+    effort_level: str,
+    ctx: Optional[Context] = None
 ) -> str:
-    """Generate comprehensive final answer from research results."""
+    """Generate comprehensive final answer from research results.
+    
+    The answer is streamed from the model; when an MCP context is given, each
+    chunk is forwarded to the client as it arrives so the report starts
+    rendering before generation finishes.
+    """
     
     if not results:
         return f"No research results were obtained for the topic: {research_topic}"
     
-    # Combine all research content
-    combined_research = "\n\n".join([
-        f"Research Query: {result.query_used}\n{result.content}"
-        for result in results
-    ])
+    # Large result sets are condensed batch by batch so the final prompt stays bounded
+    if len(results) > SUMMARY_BATCH_SIZE:
+        summaries = await asyncio.gather(*[
+            summarize_research_batch(research_topic, results[i:i + SUMMARY_BATCH_SIZE])
+            for i in range(0, len(results), SUMMARY_BATCH_SIZE)
+        ])
+        research_content = "\n\n".join(summaries)
+    else:
+        research_content = format_research_content(results)
     
-    # Collect all unique citations
-    all_citations = []
-    seen_urls = set()
+    # Collect all unique citations; dicts keep first-seen order for stable numbering
+    unique_citations: Dict[str, CitationSegment] = {}
     for result in results:
         for citation in result.citations:
-            if citation.url not in seen_urls:
-                all_citations.append(citation)
-                seen_urls.add(citation.url)
+            unique_citations.setdefault(citation.url, citation)
+    all_citations = list(unique_citations.values())
     
-    effort_context = EFFORT_TIERS[effort_level]["description"]
+    effort_context = EFFORT_TIERS[effort_level].description
     
-    prompt = f"""Based on the comprehensive research conducted, provide a detailed, well-structured answer to the research topic.
-
-Research Topic: {research_topic}
-Research Effort: {effort_level} ({effort_context})
-Current Date: {get_current_date()}
-Total Research Queries: {len(results)}
-
-Research Content:
-{combined_research}
-
-Instructions:
-- Synthesize all research findings into a comprehensive, coherent answer
-- Structure your response with clear headings and sections
-- Include key facts, statistics, expert opinions, and recent developments
-- Maintain objectivity and cite multiple perspectives where relevant
-- Ensure accuracy and avoid speculation beyond the research findings
-- Provide actionable insights or conclusions where appropriate
-- Keep the response informative yet accessible
-
-Generate a comprehensive research report that fully addresses the topic."""
+    prompt = ANSWER_PROMPT_TEMPLATE.format(
+        research_topic=research_topic,
+        effort_level=effort_level,
+        effort_context=effort_context,
+        current_date=get_current_date(),
+        num_results=len(results),
+        research_content=research_content,
+    )
 
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=ANSWER_MODEL,
-            temperature=0.2,  # Low temperature for accuracy
-            max_retries=3,
-            api_key=GEMINI_API_KEY,
-        )
+        llm = _get_llm(ANSWER_MODEL, 0.2)  # Low temperature for accuracy
         
-        response = llm.invoke(prompt)
-        final_answer = response.content
+        answer_parts = []
+        async for chunk in llm.astream(prompt):
+            if not chunk.content:
+                continue
+            answer_parts.append(chunk.content)
+            if ctx is not None:
+                await ctx.info(chunk.content)
+        final_answer = "".join(answer_parts)
         
         # Add citation appendix
         if all_citations:
@@ -525,47 +868,62 @@ Generate a comprehensive research report that fully addresses the topic."""
         # Add research metadata
         final_answer += f"\n\n---\n*Research completed on {get_current_date()} using {effort_level} effort level with {len(results)} queries*"
         
-        logger.info(f"Finalized research answer for topic: {research_topic}")
+        logger.info("Finalized research answer for topic: %s", research_topic)
         return final_answer
         
     except Exception as e:
-        logger.error(f"Error finalizing research answer: {e}")
+        logger.error("Error finalizing research answer: %s", e)
         # Fallback to simple summary
-        return f"Research Summary for: {research_topic}\n\n" + combined_research
-
+        return f"Research Summary for: {research_topic}\n\n" + research_content
 
-# MCP Tool Implementations
 
-@mcp.tool(
-    description="Conduct comprehensive research on any topic with configurable effort levels and intelligent search capabilities"
-)
-async def research_topic(
-    topic: str = Field(
-        description="The research topic, question, or subject to investigate thoroughly",
-        min_length=1,
-        max_length=500
-    ),
-    effort: Literal["low", "medium", "high"] = Field(
-        default="medium",
-        description="Research effort level: low (10 searches max, 1 loop), medium (100 searches max, 3 loops), high (1000 searches max, 5 loops)"
-    )
-) -> str:
+async def run_search_batch(research_state: ResearchState, queries: List[str]) -> int:
+    """Run a batch of searches concurrently and record the results on the research state.
+    
+    Queries already dispatched in this session, or repeated within the batch,
+    are dropped before the batch is trimmed to the remaining search budget.
+    Search IDs are assigned sequentially from the current search count. A
+    search task that raises is recorded as a failed-search placeholder like
+    any other failure. Returns the number of searches dispatched.
     """
-    Conduct comprehensive research on any topic using Google's Gemini AI with tiered effort levels.
+    pending: List[str] = []
+    for query in queries:
+        if len(pending) >= research_state.searches_remaining:
+            break
+        canonical = canonicalize_query(query)
+        if canonical in research_state.completed_queries:
+            logger.info("Skipping duplicate query: %s", query)
+            continue
+        research_state.completed_queries.add(canonical)
+        pending.append(query)
+    queries = pending
+    first_search_id = research_state.search_count
     
-    This tool performs intelligent web research with:
-    - Multi-stage search query generation
-    - Iterative research loops with reflection
-    - Citation tracking and source validation
-    - Comprehensive answer synthesis
+    search_results = await asyncio.gather(
+        *[
+            perform_web_search(query, first_search_id + i)
+            for i, query in enumerate(queries)
+        ],
+        return_exceptions=True
+    )
     
-    Args:
-        topic: The research topic or question to investigate
-        effort: Research intensity level (low/medium/high)
+    for i, search_result in enumerate(search_results):
+        if isinstance(search_result, BaseException):
+            logger.warning("Search task failed: %s", search_result)
+            search_result = failed_search_result(queries[i], first_search_id + i, search_result)
+        
+        research_state.results.append(search_result)
+        research_state.search_count += 1
     
-    Returns:
-        Comprehensive research report with citations and sources
-    """
+    return len(queries)
+
+
+async def conduct_research(
+    topic: str,
+    effort: Literal["low", "medium", "high"],
+    ctx: Optional[Context] = None
+) -> str:
+    """Run the full research pipeline for one topic and return the final report."""
     
     if not topic.strip():
         return "Error: Research topic cannot be empty."
@@ -573,34 +931,28 @@ async def research_topic(
     topic = topic.strip()
     session_id = generate_session_id(topic, effort)
     
-    logger.info(f"Starting research session {session_id} for topic: {topic} (effort: {effort})")
+    logger.info(
+        "Starting research session %s for topic: %s (effort: %s)", session_id, topic, effort
+    )
+    
+    # Initialize research state
+    research_state = ResearchState(topic=topic, effort_level=effort)
+    active_research_sessions[session_id] = research_state
     
     try:
-        # Initialize research state
-        research_state = ResearchState(topic=topic, effort_level=effort)
-        active_research_sessions[session_id] = research_state
-        
         config = EFFORT_TIERS[effort]
         
         # Phase 1: Generate initial search queries
         initial_query_list = await generate_search_queries(
             topic, 
-            config["initial_queries"]
+            config.initial_queries
         )
         
-        # Phase 2: Conduct initial research
-        for i, query_obj in enumerate(initial_query_list.queries):
-            if not research_state.can_continue:
-                break
-                
-            search_result = await perform_web_search(
-                query_obj.query, 
-                research_state.search_count
-            )
-            
-            research_state.results.append(search_result)
-            research_state.all_citations.extend(search_result.citations)
-            research_state.search_count += 1
+        # Phase 2: Conduct initial research concurrently
+        await run_search_batch(
+            research_state,
+            [query_obj.query for query_obj in initial_query_list.queries]
+        )
         
         # Phase 3: Iterative research loops with reflection
         while research_state.can_continue and research_state.loop_count < research_state.max_loops:
@@ -615,46 +967,119 @@ async def research_topic(
             
             # Check if research is sufficient
             if reflection.is_sufficient or reflection.confidence_score > 0.8:
-                logger.info(f"Research deemed sufficient after {research_state.loop_count} loops")
+                logger.info("Research deemed sufficient after %s loops", research_state.loop_count)
                 break
             
-            # Generate follow-up queries based on knowledge gaps
+            # Search all follow-up queries for the identified knowledge gaps at once
+            dispatched = 0
             if reflection.follow_up_queries and research_state.searches_remaining > 0:
-                follow_up_queries = reflection.follow_up_queries[:research_state.searches_remaining]
-                
-                for query in follow_up_queries:
-                    if not research_state.can_continue:
-                        break
-                    
-                    search_result = await perform_web_search(
-                        query, 
-                        research_state.search_count
-                    )
-                    
-                    research_state.results.append(search_result)
-                    research_state.all_citations.extend(search_result.citations)
-                    research_state.search_count += 1
+                dispatched = await run_search_batch(research_state, reflection.follow_up_queries)
+            
+            # Reflecting again on unchanged findings would only repeat this loop
+            if dispatched == 0:
+                logger.info("No new follow-up queries after %s loops", research_state.loop_count)
+                break
         
         # Phase 4: Finalize comprehensive answer
         research_state.is_complete = True
         final_answer = await finalize_research_answer(
             topic, 
             research_state.results, 
-            effort
+            effort,
+            ctx
         )
         
-        # Cleanup session
-        if session_id in active_research_sessions:
-            del active_research_sessions[session_id]
-        
-        logger.info(f"Research completed for topic: {topic}. Total searches: {research_state.search_count}")
+        logger.info("Research completed for topic: %s. Total searches: %s", topic, research_state.search_count)
         return final_answer
         
     except Exception as e:
-        logger.error(f"Error during research for topic '{topic}': {e}")
-        if session_id in active_research_sessions:
-            del active_research_sessions[session_id]
+        logger.error("Error during research for topic '%s': %s", topic, e)
         return f"Research failed due to an error: {str(e)}. Please try again or contact support."
+    
+    finally:
+        # Cleanup session and drop its results now that the report has been built
+        active_research_sessions.pop(session_id, None)
+        research_state.results.clear()
+        research_state.completed_queries.clear()
+
+
+# MCP Tool Implementations
+
+@mcp.tool(
+    description="Conduct comprehensive research on any topic with configurable effort levels and intelligent search capabilities"
+)
+async def research_topic(
+    topic: str = Field(
+        description="The research topic, question, or subject to investigate thoroughly",
+        min_length=1,
+        max_length=500
+    ),
+    effort: Literal["low", "medium", "high"] = Field(
+        default="medium",
+        description="Research effort level: low (10 searches max, 1 loop), medium (100 searches max, 3 loops), high (1000 searches max, 5 loops)"
+    ),
+    ctx: Context = None
+) -> str:
+    """
+    Conduct comprehensive research on any topic using Google's Gemini AI with tiered effort levels.
+    
+    This tool performs intelligent web research with:
+    - Multi-stage search query generation
+    - Iterative research loops with reflection
+    - Citation tracking and source validation
+    - Comprehensive answer synthesis
+    
+    Args:
+        topic: The research topic or question to investigate
+        effort: Research intensity level (low/medium/high)
+        ctx: MCP request context, injected by FastMCP, used to stream the final answer
+    
+    Returns:
+        Comprehensive research report with citations and sources
+    """
+    
+    return await conduct_research(topic, effort, ctx)
+
+
+@mcp.tool(
+    description=(
+        "Research several related topics in one call, "
+        "sharing searches that overlap between them"
+    )
+)
+async def research_topics_batch(
+    topics: List[str] = Field(
+        description=f"Research topics or questions to investigate (up to {MAX_BATCH_TOPICS})",
+        min_length=1,
+        max_length=MAX_BATCH_TOPICS
+    ),
+    effort: Literal["low", "medium", "high"] = Field(
+        default="medium",
+        description="Research effort level applied to every topic: low, medium, or high"
+    )
+) -> List[str]:
+    """
+    Conduct research on multiple topics concurrently.
+    
+    Topics run side by side, a few at a time, and identical searches issued by
+    different topics are served by a single Google Search request.
+    
+    Args:
+        topics: The research topics or questions to investigate
+        effort: Research intensity level (low/medium/high) for every topic
+    
+    Returns:
+        One research report per topic, in the order the topics were given
+    """
+    
+    topic_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOPICS)
+    
+    async def research_one(topic: str) -> str:
+        async with topic_semaphore:
+            return await conduct_research(topic, effort)
+    
+    logger.info("Starting batch research for %s topics (effort: %s)", len(topics), effort)
+    return list(await asyncio.gather(*[research_one(topic) for topic in topics[:MAX_BATCH_TOPICS]]))
 
 
 @mcp.tool(
@@ -673,10 +1098,10 @@ async def get_effort_levels() -> str:
     
     for level, config in EFFORT_TIERS.items():
         info += f"## {level.title()} Effort\n"
-        info += f"- **Max Searches**: {config['max_searches']}\n"
-        info += f"- **Max Research Loops**: {config['max_research_loops']}\n"
-        info += f"- **Initial Queries**: {config['initial_queries']}\n"
-        info += f"- **Description**: {config['description']}\n\n"
+        info += f"- **Max Searches**: {config.max_searches}\n"
+        info += f"- **Max Research Loops**: {config.max_research_loops}\n"
+        info += f"- **Initial Queries**: {config.initial_queries}\n"
+        info += f"- **Description**: {config.description}\n\n"
     
     info += "## Recommendations\n"
     info += "- **Low**: Quick fact-checking, simple questions, time-sensitive research\n"
@@ -703,21 +1128,22 @@ async def get_server_status() -> str:
     status += f"**Server Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
     status += f"**Research Model**: {RESEARCH_MODEL}\n"
     status += f"**Query Model**: {QUERY_MODEL}\n"
+    status += f"**Event Loop**: {'uvloop' if UVLOOP_AVAILABLE else 'asyncio'}\n"
     status += f"**Active Sessions**: {len(active_research_sessions)}\n\n"
     
     if active_research_sessions:
         status += "## Active Research Sessions\n"
         for session_id, state in active_research_sessions.items():
-            elapsed = datetime.now() - state.start_time
+            elapsed = int(time.monotonic() - state.start_monotonic)
             status += f"- **{session_id}**: {state.topic[:50]}{'...' if len(state.topic) > 50 else ''}\n"
             status += f"  - Effort: {state.effort_level}\n"
             status += f"  - Searches: {state.search_count}/{state.max_searches}\n"
             status += f"  - Loops: {state.loop_count}/{state.max_loops}\n"
-            status += f"  - Elapsed: {elapsed.seconds}s\n"
+            status += f"  - Elapsed: {elapsed}s\n"
     
     status += "\n## Configuration\n"
     for level, config in EFFORT_TIERS.items():
-        status += f"**{level.title()}**: {config['max_searches']} searches, {config['max_research_loops']} loops\n"
+        status += f"**{level.title()}**: {config.max_searches} searches, {config.max_research_loops} loops\n"
     
     return status
 
@@ -750,6 +1176,7 @@ The Gemini Research Agent is an advanced Model Context Protocol (MCP) server tha
 - **Query Generation**: {QUERY_MODEL}
 - **Reflection**: {REFLECTION_MODEL}
 - **Final Answer**: {ANSWER_MODEL}
+- **Result Summaries**: {SUMMARY_MODEL}
 
 ## Available Tools
 
@@ -762,6 +1189,15 @@ Conduct comprehensive research on any topic with configurable effort levels.
 
 **Returns:** Comprehensive research report with citations
 
+### research_topics_batch(topics, effort="medium")
+Research several related topics concurrently in a single call.
+
+**Parameters:**
+- `topics` (list[str]): Up to {MAX_BATCH_TOPICS} research topics or questions
+- `effort` (str): Research effort level applied to every topic
+
+**Returns:** One research report per topic, in input order
+
 ### get_effort_levels()
 Get detailed information about available research effort levels.
 
@@ -813,6 +1249,7 @@ research_topic("impact of climate change on global agriculture", effort="high")
 
 ### Rate Limiting
 - Effort-based search limits prevent API abuse
+- Concurrent searches capped by `MAX_CONCURRENT_SEARCHES` (default: {MAX_CONCURRENT_SEARCHES})
 - Exponential backoff for failed requests
 - Session tracking for resource management
 
@@ -841,9 +1278,9 @@ Comprehensive logging includes:
 # Server startup and configuration
 if __name__ == "__main__":
     try:
-        logger.info(f"Starting Gemini Research Agent MCP Server")
-        logger.info(f"Using model: {RESEARCH_MODEL}")
-        logger.info(f"Effort tiers configured: {', '.join(EFFORT_TIERS.keys())}")
+        logger.info("Starting Gemini Research Agent MCP Server")
+        logger.info("Using model: %s", RESEARCH_MODEL)
+        logger.info("Effort tiers configured: %s", ', '.join(EFFORT_TIERS.keys()))
         
         # Run the FastMCP server
         mcp.run()
@@ -851,9 +1288,13 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server startup failed: {e}")
+        logger.error("Server startup failed: %s", e)
         raise
     finally:
-        # Cleanup active sessions
+        # Cleanup active sessions and the shared connection pool
         active_research_sessions.clear()
+        try:
+            asyncio.run(close_http_client())
+        except Exception as e:
+            logger.warning("Failed to close HTTP client cleanly: %s", e)
         logger.info("Server shutdown complete")
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Response caches for the Gemini Research Agent MCP Server.
+
+Provides a bounded exact-match cache, an optional embedding-based semantic
+cache for near-identical inputs, and the ``cached_llm`` decorator that puts
+both in front of an async LLM call.
+
+The semantic cache needs the optional ``sentence-transformers`` and
+``faiss-cpu`` packages; without them only exact matches are served.
+"""
+
+import asyncio
+import functools
+import importlib.util
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# sentence-transformers is imported lazily on first embed, so only probe for it here
+SEMANTIC_CACHE_AVAILABLE = (
+    FAISS_AVAILABLE and importlib.util.find_spec("sentence_transformers") is not None
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class ExactCache:
+    """Bounded in-memory cache that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """Serves cached values for texts whose embeddings are nearly identical.
+
+    Embeddings are normalised, so inner product on a FAISS flat index is
+    cosine similarity. Entries carry a group key and only match lookups in
+    the same group, which keeps e.g. different query counts apart.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        dim: int = 384,
+        threshold: float = 0.93,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        encoder: Optional[Callable[[List[str]], Any]] = None,
+    ):
+        # A custom encoder only needs the FAISS index, not sentence-transformers
+        if not (SEMANTIC_CACHE_AVAILABLE or (FAISS_AVAILABLE and encoder is not None)):
+            raise ImportError(
+                "Semantic caching requires faiss and sentence-transformers. "
+                "Install with: pip install faiss-cpu sentence-transformers"
+            )
+        self.maxsize = maxsize
+        self.dim = dim
+        self.threshold = threshold
+        self.model_name = model_name
+        self._encoder = encoder
+        self._index = faiss.IndexIDMap(faiss.IndexFlatIP(dim))
+        self._entries: "OrderedDict[int, Tuple[Hashable, Any]]" = OrderedDict()
+        self._next_id = 0
+
+    def _encode(self, texts: List[str]) -> Any:
+        if self._encoder is None:
+            # Imported lazily: loading the model is slow and only needed on first use
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(self.model_name)
+            self._encoder = lambda batch: model.encode(batch, normalize_embeddings=True)
+        return np.asarray(self._encoder(texts), dtype="float32").reshape(len(texts), self.dim)
+
+    async def embed(self, text: str) -> Any:
+        """Embed text off the event loop and return a (1, dim) float32 array."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._encode, [text])
+
+    def lookup(self, vector: Any, group: Hashable) -> Optional[Any]:
+        """Return the value of the most similar entry in group, or None."""
+        if not self._entries:
+            return None
+        scores, ids = self._index.search(vector, min(8, len(self._entries)))
+        for score, entry_id in zip(scores[0], ids[0]):
+            if score < self.threshold:
+                break
+            entry = self._entries.get(int(entry_id))
+            if entry is not None and entry[0] == group:
+                self._entries.move_to_end(int(entry_id))
+                return entry[1]
+        return None
+
+    def add(self, vector: Any, group: Hashable, value: Any) -> None:
+        """Store value under vector, evicting the oldest entry when full."""
+        if self.maxsize <= 0:
+            return
+        entry_id = self._next_id
+        self._next_id += 1
+        self._index.add_with_ids(vector, np.array([entry_id], dtype="int64"))
+        self._entries[entry_id] = (group, value)
+        while len(self._entries) > self.maxsize:
+            old_id, _ = self._entries.popitem(last=False)
+            self._index.remove_ids(np.array([old_id], dtype="int64"))  # type: ignore[arg-type]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._index.reset()
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached_llm(
+    key_fn: Callable[..., Optional[Hashable]],
+    cache: ExactCache,
+    semantic_cache: Optional[SemanticCache] = None,
+    semantic_key_fn: Optional[Callable[..., Optional[Tuple[str, Hashable]]]] = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Serve an async LLM call from cache when possible.
+
+    key_fn maps the call arguments to an exact cache key, or None to bypass
+    caching for that call. semantic_key_fn maps them to the text to embed and
+    the group it must match in semantic_cache. Exceptions are never cached.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = key_fn(*args, **kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info("Exact cache hit for %s", func.__name__)
+                return cached
+
+            semantic_key = None
+            vector = None
+            if semantic_cache is not None and semantic_key_fn is not None:
+                semantic_key = semantic_key_fn(*args, **kwargs)
+            if semantic_key is not None:
+                text, group = semantic_key
+                try:
+                    vector = await semantic_cache.embed(text)
+                    cached = semantic_cache.lookup(vector, group)
+                except Exception as e:
+                    # The semantic tier is best effort; never let it replace the real call
+                    logger.warning("Semantic cache lookup failed for %s: %s", func.__name__, e)
+                    vector = None
+                    cached = None
+                if cached is not None:
+                    logger.info("Semantic cache hit for %s", func.__name__)
+                    cache.set(key, cached)
+                    return cached
+
+            result = await func(*args, **kwargs)
+            cache.set(key, result)
+            if vector is not None:
+                try:
+                    semantic_cache.add(vector, semantic_key[1], result)
+                except Exception as e:
+                    logger.warning("Semantic cache store failed for %s: %s", func.__name__, e)
+            return result
+
+        return wrapper
+    return decorator
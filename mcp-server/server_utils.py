@@ -0,0 +1,69 @@
+"""
+Pure helper functions for the Gemini Research Agent MCP Server.
+
+These utilities are fully typed and free of server state so they can be
+compiled with mypyc (see setup.py); the plain Python source is used when no
+compiled module is installed.
+"""
+
+import re
+import secrets
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+# Precompiled patterns for URL validation: web source URLs and any scheme
+_HTTP_URL_RE = re.compile(r'^https?://[^\s/]+', re.IGNORECASE)
+_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s/?#]+')
+_FAST_URL_PREFIXES = ("https://", "http://", "ftp://")
+
+# Formatted current date, reused until it expires at the next local midnight
+_current_date_cache: Dict[str, Any] = {"expires": 0.0, "value": ""}
+
+
+def get_current_date() -> str:
+    """Get current date in human-readable format."""
+    if time.time() >= _current_date_cache["expires"]:
+        now = datetime.now()
+        next_midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        _current_date_cache["value"] = now.strftime("%B %d, %Y")
+        _current_date_cache["expires"] = next_midnight.timestamp()
+    return _current_date_cache["value"]
+
+
+def generate_session_id(topic: str, effort_level: str) -> str:
+    """Generate unique session ID for research tracking.
+    
+    The ID is 12 random hex characters; topic and effort level are accepted for
+    API compatibility but not needed for uniqueness. It is deliberately not a
+    hash of the inputs: concurrent sessions on the same topic would collide
+    and overwrite each other in active_research_sessions.
+    """
+    return secrets.token_hex(6)
+
+
+def validate_url(url: Any) -> bool:
+    """Validate if URL is properly formatted with a scheme and a host."""
+    if not isinstance(url, str) or not url:
+        return False
+    # Fast path for the common schemes; anything else falls back to the full pattern
+    for prefix in _FAST_URL_PREFIXES:
+        if url.startswith(prefix):
+            return len(url) > len(prefix) and url[len(prefix)] not in "/?#"
+    return _URL_RE.match(url) is not None
+
+
+def validate_urls(urls: List[Any], web_only: bool = False) -> List[bool]:
+    """Validate a batch of URLs in one pass, returning a mask in input order.
+    
+    With web_only, only HTTP(S) URLs with a host are accepted.
+    """
+    if web_only:
+        match = _HTTP_URL_RE.match
+        return [isinstance(url, str) and match(url) is not None for url in urls]
+    return [validate_url(url) for url in urls]
+
+
+def canonicalize_query(query: str) -> str:
+    """Normalize case and whitespace so trivially different queries compare equal."""
+    return " ".join(query.lower().split())
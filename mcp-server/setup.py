@@ -17,6 +17,20 @@ def read_readme():
     except FileNotFoundError:
         return "Gemini Research Agent MCP Server"
 
+# Compile the pure helper module with mypyc when requested (MYPYC_COMPILE=1);
+# otherwise the plain Python source is installed and behaves identically
+def build_ext_modules():
+    if os.getenv("MYPYC_COMPILE", "").lower() not in ("1", "true", "yes"):
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError as e:
+        raise RuntimeError(
+            "MYPYC_COMPILE is set but mypyc is not installed. "
+            "Install with: pip install -e .[compiled]"
+        ) from e
+    return mypycify(["server_utils.py"])
+
 # Read requirements from requirements.txt
 def read_requirements():
     try:
@@ -35,6 +49,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/your-username/gemini-research-agent-mcp",
     packages=find_packages(),
+    py_modules=["server", "server_cache", "server_utils"],
+    ext_modules=build_ext_modules(),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -42,8 +58,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -52,7 +66,7 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Topic :: Text Processing :: Linguistic",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=read_requirements(),
     extras_require={
         "dev": [
@@ -66,6 +80,13 @@ setup(
         "performance": [
             "uvloop>=0.19.0; sys_platform != 'win32'",
         ],
+        "compiled": [
+            "mypy>=1.7.0",
+        ],
+        "semantic-cache": [
+            "sentence-transformers>=2.2.0",
+            "faiss-cpu>=1.7.4",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -11,8 +11,9 @@ Run with: pytest test_server.py -v
 import pytest
 import asyncio
 import os
+import sys
 from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 
 # Import server components
@@ -22,18 +23,61 @@ from server import (
     SearchQueryList,
     ResearchReflection,
     CitationSegment,
+    CitationBlock,
     SearchResult,
     EFFORT_TIERS,
     get_current_date,
     generate_session_id,
     validate_url,
+    validate_urls,
     resolve_urls,
     insert_citation_markers,
     generate_search_queries,
     perform_web_search,
     reflect_on_research,
     finalize_research_answer,
+    run_search_batch,
+    research_topics_batch,
+    conduct_research,
+    active_research_sessions,
+    close_http_client,
+    mcp,
+    _search_cache,
+    _query_cache,
+    _reflection_cache,
+    _get_llm,
 )
+from server_utils import _current_date_cache
+from server_cache import FAISS_AVAILABLE, ExactCache, SemanticCache, cached_llm
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Reset module-level caches and shared clients so tests stay independent."""
+    _search_cache.clear()
+    _query_cache.clear()
+    _reflection_cache.clear()
+    _get_llm.cache_clear()
+    yield
+    _search_cache.clear()
+    _query_cache.clear()
+    _reflection_cache.clear()
+    _get_llm.cache_clear()
+    _current_date_cache["expires"] = 0.0
+
+
+def mock_search_stream(*chunks):
+    """Build a generate_content_stream stand-in that yields the given chunks."""
+    async def stream():
+        for chunk in chunks:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    
+    async def generate_content_stream(**kwargs):
+        return stream()
+    
+    return AsyncMock(side_effect=generate_content_stream)
 
 
 class TestDataModels:
@@ -53,6 +97,10 @@ class TestDataModels:
         # Invalid empty query
         with pytest.raises(ValueError):
             SearchQuery(query="", rationale="rationale")
+        
+        # Whitespace-only query is empty once stripped
+        with pytest.raises(ValueError):
+            SearchQuery(query="   ", rationale="rationale")
     
     def test_research_state_properties(self):
         """Test ResearchState dataclass properties."""
@@ -71,6 +119,33 @@ class TestDataModels:
         state.search_count = 100
         assert state.can_continue is False
     
+    def test_research_state_is_slotted(self):
+        """Test ResearchState uses slots rather than a per-instance __dict__."""
+        state = ResearchState(topic="test", effort_level="low")
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown_field = 1
+    
+    @pytest.mark.asyncio
+    async def test_research_state_skips_duplicate_queries(self):
+        """Test queries already dispatched, up to case and whitespace, are not searched again."""
+        state = ResearchState(topic="test", effort_level="low")
+        
+        async def fake_search(query, search_id):
+            return SearchResult(
+                content=query, citations=CitationBlock(), query_used=query, search_id=search_id
+            )
+        
+        with patch('server.perform_web_search', side_effect=fake_search) as mock_search:
+            assert await run_search_batch(state, ["Quantum computing", "quantum  COMPUTING "]) == 1
+            assert await run_search_batch(state, [" quantum computing", "qubit error rates"]) == 1
+            assert await run_search_batch(state, ["Qubit error rates"]) == 0
+        
+        searched = [c.args[0] for c in mock_search.call_args_list]
+        assert searched == ["Quantum computing", "qubit error rates"]
+        assert [r.search_id for r in state.results] == [0, 1]
+        assert state.completed_queries == {"quantum computing", "qubit error rates"}
+    
     def test_citation_segment_model(self):
         """Test CitationSegment model."""
         citation = CitationSegment(
@@ -82,6 +157,29 @@ class TestDataModels:
         assert citation.short_url == "[1]"
         assert citation.title == "Test Title"
         assert citation.snippet is None
+        
+        # Citations are immutable and hashable, so equal citations collapse in a set
+        duplicate = CitationSegment(url="https://example.com", short_url="[1]", title="Test Title")
+        assert len({citation, duplicate}) == 1
+        with pytest.raises(AttributeError):
+            citation.url = "https://other.com"
+    
+    def test_citation_block_views(self):
+        """Test CitationBlock stores fields column-wise and yields segment views."""
+        segments = [
+            CitationSegment(url="https://a.com", short_url="[1-0]", title="A"),
+            CitationSegment(url="https://b.com", short_url="[1-1]", title="B", snippet="Snippet"),
+        ]
+        block = CitationBlock.from_segments(segments)
+        
+        assert block.urls == ["https://a.com", "https://b.com"]
+        assert block.snippets == [None, "Snippet"]
+        assert len(block) == 2
+        assert block[1] == segments[1]
+        assert list(block) == segments
+        assert block[:1] == CitationBlock.from_segments(segments[:1])
+        with pytest.raises(TypeError):
+            block["0"]
 
 
 class TestUtilityFunctions:
@@ -99,16 +197,44 @@ class TestUtilityFunctions:
         except ValueError:
             pytest.fail("Date format is incorrect")
     
+    def test_get_current_date_is_cached(self):
+        """Test the formatted date is reused until it expires."""
+        expected = get_current_date()
+        
+        with patch('server_utils.datetime') as mock_datetime:
+            assert get_current_date() == expected
+            mock_datetime.now.assert_not_called()
+        
+        # Once expired, the date is recomputed
+        with patch('server_utils.time.time', return_value=_current_date_cache["expires"]), \
+             patch('server_utils.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2030, 1, 2, 10, 30)
+            assert get_current_date() == "January 02, 2030"
+    
+    def test_get_current_date_expires_at_local_midnight(self):
+        """Test the cached date rolls over at local midnight, not at the UTC day boundary."""
+        _current_date_cache["expires"] = 0.0
+        now = datetime.now()
+        get_current_date()
+        
+        expires = datetime.fromtimestamp(_current_date_cache["expires"])
+        assert (expires.hour, expires.minute, expires.second) == (0, 0, 0)
+        assert now < expires <= now + timedelta(days=1)
+    
     def test_generate_session_id(self):
         """Test session ID generation."""
         session_id = generate_session_id("test topic", "medium")
         assert isinstance(session_id, str)
-        assert len(session_id) == 12  # MD5 hash truncated to 12 chars
+        assert len(session_id) == 12  # 6 random bytes as hex
+        int(session_id, 16)  # Hex digits only, safe to embed in logs and resource names
         
         # Different inputs should generate different IDs
         id1 = generate_session_id("topic1", "low")
         id2 = generate_session_id("topic2", "high")
         assert id1 != id2
+        
+        # Identical inputs must not collide, or concurrent sessions would overwrite each other
+        assert len({generate_session_id("same topic", "low") for _ in range(100)}) == 100
     
     def test_validate_url(self):
         """Test URL validation function."""
@@ -122,17 +248,26 @@ class TestUtilityFunctions:
         assert validate_url("") is False
         assert validate_url("ftp://example.com") is True  # Valid but different scheme
         assert validate_url("//example.com") is False  # Missing scheme
+        assert validate_url("https://") is False  # Missing host
+        # Uncommon scheme via full pattern
+        assert validate_url("git+ssh://example.com/repo") is True
+        
+        # Batch validation returns a mask in input order
+        urls = ["https://example.com", "ftp://example.com", None, "not-a-url"]
+        assert validate_urls(urls) == [True, True, False, False]
+        assert validate_urls(urls, web_only=True) == [True, False, False, False]
+        assert validate_urls(["HTTPS://example.com"], web_only=True) == [True]
     
     def test_insert_citation_markers(self):
         """Test citation marker insertion."""
         text = "This is a test text."
-        citations = [
+        citations = CitationBlock.from_segments([
             CitationSegment(
                 url="https://example.com",
                 short_url="[1]",
                 title="Example Source"
             )
-        ]
+        ])
         
         result = insert_citation_markers(text, citations)
         assert "This is a test text." in result
@@ -140,8 +275,45 @@ class TestUtilityFunctions:
         assert "[1] [Example Source](https://example.com)" in result
         
         # Test with empty citations
-        result = insert_citation_markers(text, [])
+        result = insert_citation_markers(text, CitationBlock())
         assert result == text
+    
+    def test_lru_cache_eviction(self):
+        """Test LRU cache evicts the least recently used entry."""
+        cache = ExactCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" is now most recently used
+        
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+        
+        # Zero-sized cache stores nothing
+        disabled = ExactCache(maxsize=0)
+        disabled.set("a", 1)
+        assert disabled.get("a") is None
+    
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss not installed")
+    @pytest.mark.asyncio
+    async def test_semantic_cache_matches_similar_text(self):
+        """Test near-identical texts hit within a group and miss across groups."""
+        vectors = {
+            "quantum computing": [1.0, 0.0],
+            "quantum computing ": [0.99, 0.141],
+            "gardening tips": [0.0, 1.0],
+        }
+        cache = SemanticCache(
+            dim=2, threshold=0.93, encoder=lambda texts: [vectors[t] for t in texts]
+        )
+        
+        cache.add(await cache.embed("quantum computing"), 3, "cached queries")
+        
+        assert cache.lookup(await cache.embed("quantum computing "), 3) == "cached queries"
+        assert cache.lookup(await cache.embed("quantum computing "), 5) is None
+        assert cache.lookup(await cache.embed("gardening tips"), 3) is None
 
 
 class TestAsyncFunctions:
@@ -150,19 +322,15 @@ class TestAsyncFunctions:
     @pytest.mark.asyncio
     async def test_generate_search_queries(self):
         """Test search query generation."""
-        with patch('server.ChatGoogleGenerativeAI') as mock_llm_class:
-            # Mock the LLM response
-            mock_llm = Mock()
-            mock_structured_llm = Mock()
-            mock_structured_llm.invoke = AsyncMock(return_value=SearchQueryList(
+        mock_structured_llm = Mock()
+        with patch('server._get_llm', return_value=mock_structured_llm):
+            mock_structured_llm.ainvoke = AsyncMock(return_value=SearchQueryList(
                 queries=[
                     SearchQuery(query="test query 1", rationale="rationale 1"),
                     SearchQuery(query="test query 2", rationale="rationale 2")
                 ],
                 rationale="Overall rationale"
             ))
-            mock_llm.with_structured_output.return_value = mock_structured_llm
-            mock_llm_class.return_value = mock_llm
             
             result = await generate_search_queries("test topic", 2)
             
@@ -170,12 +338,149 @@ class TestAsyncFunctions:
             assert len(result.queries) == 2
             assert result.queries[0].query == "test query 1"
     
+    @pytest.mark.asyncio
+    async def test_generate_search_queries_cache_hit(self):
+        """Test repeated query generation for the same topic skips the LLM."""
+        mock_structured_llm = Mock()
+        with patch('server._get_llm', return_value=mock_structured_llm):
+            mock_structured_llm.ainvoke = AsyncMock(return_value=SearchQueryList(
+                queries=[SearchQuery(query="test query 1", rationale="rationale 1")],
+                rationale="Overall rationale"
+            ))
+            
+            first = await generate_search_queries("test topic", 1)
+            second = await generate_search_queries("test topic", 1)
+            
+            assert second is first
+            assert mock_structured_llm.ainvoke.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm(self):
+        """Test reflecting twice on identical findings invokes the LLM once."""
+        mock_structured_llm = Mock()
+        with patch('server._get_llm', return_value=mock_structured_llm):
+            mock_structured_llm.ainvoke = AsyncMock(return_value=ResearchReflection(
+                is_sufficient=True,
+                knowledge_gap="No gaps",
+                follow_up_queries=[],
+                confidence_score=0.9
+            ))
+            
+            results = [
+                SearchResult(content="c", citations=CitationBlock(), query_used="q", search_id=0)
+            ]
+            first = await reflect_on_research("test topic", results, "low")
+            second = await reflect_on_research("test topic", results, "low")
+            
+            assert second is first
+            assert mock_structured_llm.ainvoke.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_perform_web_search_cache_hit(self):
+        """Test repeated searches reuse the cached response with fresh citation IDs."""
+        mock_response = Mock(text="Search content")
+        mock_response.candidates = [Mock()]
+        mock_response.candidates[0].grounding_metadata.grounding_chunks = [
+            Mock(web=Mock(uri="https://valid.com", title="Valid Title", snippet=None))
+        ]
+        
+        with patch('server.genai_client') as mock_client:
+            mock_client.aio.models.generate_content_stream = mock_search_stream(mock_response)
+            
+            first = await perform_web_search("test query", 1)
+            second = await perform_web_search("test query", 7)
+            
+            assert mock_client.aio.models.generate_content_stream.await_count == 1
+            assert first.citations[0].short_url == "[1-0]"
+            assert second.citations[0].short_url == "[7-0]"
+            assert "[7-0]" in second.content
+            assert second.search_id == 7
+    
+    @pytest.mark.asyncio
+    async def test_llm_clients_are_reused(self):
+        """Test chat models are constructed once and shared across calls."""
+        with patch('server.ChatGoogleGenerativeAI') as mock_llm_class:
+            mock_llm = Mock()
+            mock_structured_llm = Mock()
+            mock_structured_llm.ainvoke = AsyncMock(return_value=ResearchReflection(
+                is_sufficient=True,
+                knowledge_gap="No gaps",
+                follow_up_queries=[],
+                confidence_score=0.9
+            ))
+            mock_llm.with_structured_output.return_value = mock_structured_llm
+            mock_llm_class.return_value = mock_llm
+            
+            results = [
+                SearchResult(content="c", citations=CitationBlock(), query_used="q", search_id=0)
+            ]
+            await reflect_on_research("topic one", results, "low")
+            await reflect_on_research("topic two", results, "low")
+            
+            assert mock_llm_class.call_count == 1
+            assert mock_llm.with_structured_output.call_count == 1
+            assert mock_structured_llm.ainvoke.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_perform_web_search_accumulates_stream(self):
+        """Test streamed text and grounding metadata are combined into one result."""
+        final_chunk = Mock(text="content")
+        final_chunk.candidates = [Mock()]
+        final_chunk.candidates[0].grounding_metadata.grounding_chunks = [
+            Mock(web=Mock(uri="https://valid.com", title="Valid Title", snippet=None))
+        ]
+        
+        with patch('server.genai_client') as mock_client:
+            mock_client.aio.models.generate_content_stream = mock_search_stream(
+                Mock(text="Search ", candidates=[]), Mock(text=None, candidates=[]), final_chunk
+            )
+            
+            result = await perform_web_search("test query", 3)
+            
+            assert result.content.startswith("Search content")
+            assert [c.url for c in result.citations] == ["https://valid.com"]
+            assert "[3-0]" in result.content
+    
+    @pytest.mark.asyncio
+    async def test_perform_web_search_coalesces_inflight_requests(self):
+        """Test concurrent identical searches share a single API request."""
+        mock_response = Mock(text="Search content")
+        mock_response.candidates = []
+        
+        async def slow_stream():
+            await asyncio.sleep(0.01)
+            yield mock_response
+        
+        async def slow_generate(**kwargs):
+            return slow_stream()
+        
+        with patch('server.genai_client') as mock_client:
+            mock_client.aio.models.generate_content_stream = AsyncMock(side_effect=slow_generate)
+            
+            first, second = await asyncio.gather(
+                perform_web_search("shared query", 1),
+                perform_web_search("shared query", 2)
+            )
+            
+            assert mock_client.aio.models.generate_content_stream.await_count == 1
+            assert first.content == second.content == "Search content"
+            assert (first.search_id, second.search_id) == (1, 2)
+    
+    def test_llm_clients_keyed_by_output_limit(self):
+        """Test models with different output token limits are cached separately."""
+        with patch('server.ChatGoogleGenerativeAI') as mock_llm_class:
+            _get_llm("model", 0.2)
+            limited = _get_llm("model", 0.2, max_output_tokens=256)
+            
+            assert _get_llm("model", 0.2, max_output_tokens=256) is limited
+            assert mock_llm_class.call_count == 2
+            assert "max_output_tokens" not in mock_llm_class.call_args_list[0].kwargs
+            assert mock_llm_class.call_args_list[1].kwargs["max_output_tokens"] == 256
+    
     @pytest.mark.asyncio
     async def test_generate_search_queries_fallback(self):
         """Test search query generation fallback on error."""
-        with patch('server.ChatGoogleGenerativeAI') as mock_llm_class:
-            # Mock LLM to raise an exception
-            mock_llm_class.side_effect = Exception("API Error")
+        with patch('server._get_llm', side_effect=Exception("API Error")):
             
             result = await generate_search_queries("test topic", 2)
             
@@ -190,29 +495,26 @@ class TestAsyncFunctions:
         mock_results = [
             SearchResult(
                 content="Test content 1",
-                citations=[],
+                citations=CitationBlock(),
                 query_used="query 1",
                 search_id=1
             ),
             SearchResult(
                 content="Test content 2",
-                citations=[],
+                citations=CitationBlock(),
                 query_used="query 2",
                 search_id=2
             )
         ]
         
-        with patch('server.ChatGoogleGenerativeAI') as mock_llm_class:
-            mock_llm = Mock()
-            mock_structured_llm = Mock()
-            mock_structured_llm.invoke = AsyncMock(return_value=ResearchReflection(
+        mock_structured_llm = Mock()
+        with patch('server._get_llm', return_value=mock_structured_llm):
+            mock_structured_llm.ainvoke = AsyncMock(return_value=ResearchReflection(
                 is_sufficient=True,
                 knowledge_gap="No gaps",
                 follow_up_queries=[],
                 confidence_score=0.9
             ))
-            mock_llm.with_structured_output.return_value = mock_structured_llm
-            mock_llm_class.return_value = mock_llm
             
             result = await reflect_on_research("test topic", mock_results, "medium")
             
@@ -220,6 +522,101 @@ class TestAsyncFunctions:
             assert result.is_sufficient is True
             assert result.confidence_score == 0.9
     
+    @pytest.mark.asyncio
+    async def test_finalize_research_answer_streams_to_context(self):
+        """Test that final answer chunks are forwarded to the MCP context."""
+        mock_results = [
+            SearchResult(
+                content="Test content",
+                citations=CitationBlock.from_segments([
+                    CitationSegment(
+                        url="https://example.com",
+                        short_url="[0-0]",
+                        title="Example Source"
+                    )
+                ]),
+                query_used="query 1",
+                search_id=0
+            )
+        ]
+        
+        async def mock_stream(prompt):
+            for text in ["Final ", "", "answer"]:
+                yield Mock(content=text)
+        
+        mock_llm = Mock()
+        with patch('server._get_llm', return_value=mock_llm):
+            mock_llm.astream = mock_stream
+            mock_ctx = Mock()
+            mock_ctx.info = AsyncMock()
+            
+            result = await finalize_research_answer("test topic", mock_results, "low", mock_ctx)
+            
+            assert result.startswith("Final answer")
+            assert "1. [Example Source](https://example.com)" in result
+            assert [c.args[0] for c in mock_ctx.info.await_args_list] == ["Final ", "answer"]
+    
+    @pytest.mark.asyncio
+    async def test_finalize_research_answer_deduplicates_citations(self):
+        """Test sources appendix lists each URL once in first-seen order."""
+        def make_result(search_id, urls):
+            return SearchResult(
+                content=f"Content {search_id}",
+                citations=CitationBlock.from_segments([
+                    CitationSegment(url=url, short_url=f"[{search_id}-{i}]", title=url)
+                    for i, url in enumerate(urls)
+                ]),
+                query_used=f"query {search_id}",
+                search_id=search_id
+            )
+        
+        mock_results = [
+            make_result(0, ["https://a.com", "https://b.com"]),
+            make_result(1, ["https://b.com", "https://c.com"]),
+        ]
+        
+        async def mock_stream(prompt):
+            yield Mock(content="Answer")
+        
+        mock_llm = Mock()
+        with patch('server._get_llm', return_value=mock_llm):
+            mock_llm.astream = mock_stream
+            
+            result = await finalize_research_answer("test topic", mock_results, "low")
+            
+            assert "1. [https://a.com](https://a.com)" in result
+            assert "2. [https://b.com](https://b.com)" in result
+            assert "3. [https://c.com](https://c.com)" in result
+            assert result.count("(https://b.com)") == 1
+    
+    @pytest.mark.asyncio
+    async def test_finalize_research_answer_summarizes_large_result_sets(self):
+        """Test large result sets are condensed in batches before the final prompt."""
+        mock_results = [
+            SearchResult(
+                content=f"Content {i}", citations=CitationBlock(),
+                query_used=f"query {i}", search_id=i,
+            )
+            for i in range(12)
+        ]
+        final_prompts = []
+        
+        async def mock_stream(prompt):
+            final_prompts.append(prompt)
+            yield Mock(content="Answer")
+        
+        mock_llm = Mock()
+        with patch('server._get_llm', return_value=mock_llm):
+            mock_llm.ainvoke = AsyncMock(return_value=Mock(content="Batch summary"))
+            mock_llm.astream = mock_stream
+            
+            result = await finalize_research_answer("test topic", mock_results, "medium")
+            
+            assert result.startswith("Answer")
+            assert mock_llm.ainvoke.await_count == 2  # 12 results in batches of 10
+            assert final_prompts[0].count("Batch summary") == 2
+            assert "Content 11" not in final_prompts[0]
+    
     @pytest.mark.asyncio
     async def test_reflect_on_research_empty_results(self):
         """Test research reflection with empty results."""
@@ -229,11 +626,60 @@ class TestAsyncFunctions:
         assert result.is_sufficient is False
         assert result.confidence_score == 0.0
         assert "test topic" in result.follow_up_queries[0]
+    
+    @pytest.mark.asyncio
+    async def test_run_search_batch(self):
+        """Test batched searches respect the budget and record results in order."""
+        state = ResearchState(topic="test", effort_level="low")
+        state.search_count = 7  # 3 searches left at low effort
+        
+        async def fake_search(query, search_id):
+            if query == "bad":
+                raise RuntimeError("boom")
+            return SearchResult(
+                content=query,
+                citations=CitationBlock.from_segments([
+                    CitationSegment(
+                        url="https://example.com", short_url=f"[{search_id}-0]", title=query
+                    )
+                ]),
+                query_used=query,
+                search_id=search_id
+            )
+        
+        with patch('server.perform_web_search', side_effect=fake_search) as mock_search:
+            await run_search_batch(state, ["q1", "bad", "q3", "q4"])
+        
+        assert mock_search.call_count == 3
+        assert [r.search_id for r in state.results] == [7, 8, 9]
+        assert "Search failed" in state.results[1].content
+        assert state.results[1].query_used == "bad"
+        assert state.search_count == 10
+        assert state.searches_remaining == 0
+    
+    @pytest.mark.asyncio
+    async def test_research_topics_batch(self):
+        """Test batch research returns one report per topic in input order."""
+        async def fake_research(topic, effort):
+            await asyncio.sleep(0.01 if topic == "first" else 0)
+            return f"Report on {topic} ({effort})"
+        
+        with patch('server.conduct_research', side_effect=fake_research) as mock_research:
+            reports = await research_topics_batch(["first", "second"], "low")
+        
+        assert reports == ["Report on first (low)", "Report on second (low)"]
+        assert mock_research.call_count == 2
 
 
 class TestConfiguration:
     """Test configuration and constants."""
     
+    @pytest.mark.skipif(sys.platform == "win32", reason="uvloop does not support Windows")
+    def test_uvloop_installed_on_linux(self):
+        """Test the uvloop event loop policy is installed when uvloop is available."""
+        uvloop = pytest.importorskip("uvloop")
+        assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+    
     def test_effort_tiers_configuration(self):
         """Test effort tier configurations."""
         assert "low" in EFFORT_TIERS
@@ -242,22 +688,31 @@ class TestConfiguration:
         
         # Verify tier values
         low_tier = EFFORT_TIERS["low"]
-        assert low_tier["max_searches"] == 10
-        assert low_tier["max_research_loops"] == 1
-        assert low_tier["initial_queries"] == 2
+        assert low_tier.max_searches == 10
+        assert low_tier.max_research_loops == 1
+        assert low_tier.initial_queries == 2
         
         medium_tier = EFFORT_TIERS["medium"]
-        assert medium_tier["max_searches"] == 100
-        assert medium_tier["max_research_loops"] == 3
-        assert medium_tier["initial_queries"] == 4
+        assert medium_tier.max_searches == 100
+        assert medium_tier.max_research_loops == 3
+        assert medium_tier.initial_queries == 4
         
         high_tier = EFFORT_TIERS["high"]
-        assert high_tier["max_searches"] == 1000
-        assert high_tier["max_research_loops"] == 5
-        assert high_tier["initial_queries"] == 6
+        assert high_tier.max_searches == 1000
+        assert high_tier.max_research_loops == 5
+        assert high_tier.initial_queries == 6
         
         # Verify ascending order
-        assert low_tier["max_searches"] < medium_tier["max_searches"] < high_tier["max_searches"]
+        assert low_tier.max_searches < medium_tier.max_searches < high_tier.max_searches
+    
+    def test_genai_requests_carry_request_timeout(self):
+        """Test REQUEST_TIMEOUT reaches the requests google-genai builds."""
+        import server
+        request = server.genai_client._api_client._build_request(
+            "post", "models/gemini-2.0-flash:generateContent", {}
+        )
+        assert request.timeout is not None
+        assert request.timeout == pytest.approx(server.REQUEST_TIMEOUT)
 
 
 class TestErrorHandling:
@@ -266,9 +721,12 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_perform_web_search_error_handling(self):
         """Test web search error handling."""
-        with patch('server.genai_client') as mock_client:
-            # Mock client to raise an exception
-            mock_client.models.generate_content.side_effect = Exception("API Error")
+        with patch('server.genai_client') as mock_client, \
+             patch('server.asyncio.sleep', new=AsyncMock()):
+            # Mock the stream to fail after the first chunk
+            mock_client.aio.models.generate_content_stream = mock_search_stream(
+                Mock(text="Partial", candidates=[]), Exception("API Error")
+            )
             
             result = await perform_web_search("test query", 1)
             
@@ -277,6 +735,38 @@ class TestErrorHandling:
             assert result.query_used == "test query"
             assert result.search_id == 1
     
+    @pytest.mark.asyncio
+    async def test_cached_llm_does_not_cache_errors(self):
+        """Test failed LLM calls are retried rather than served from cache."""
+        llm_call = AsyncMock(side_effect=[Exception("API Error"), "answer"])
+        cached_call = cached_llm(key_fn=lambda prompt: prompt, cache=ExactCache())(llm_call)
+        
+        with pytest.raises(Exception):
+            await cached_call("prompt")
+        assert await cached_call("prompt") == "answer"
+        assert await cached_call("prompt") == "answer"
+        assert llm_call.await_count == 2
+    
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss not installed")
+    @pytest.mark.asyncio
+    async def test_cached_llm_survives_semantic_cache_errors(self):
+        """Test an embedding failure falls through to the real LLM call."""
+        def broken_encoder(texts):
+            raise RuntimeError("model download failed")
+        
+        semantic_cache = SemanticCache(dim=2, encoder=broken_encoder)
+        llm_call = AsyncMock(return_value="answer")
+        cached_call = cached_llm(
+            key_fn=lambda prompt: prompt,
+            cache=ExactCache(),
+            semantic_cache=semantic_cache,
+            semantic_key_fn=lambda prompt: (prompt, None),
+        )(llm_call)
+        
+        assert await cached_call("prompt") == "answer"
+        assert llm_call.await_count == 1
+        assert len(semantic_cache) == 0
+    
     def test_resolve_urls_error_handling(self):
         """Test URL resolution error handling."""
         # Mock grounding chunks with various error conditions
@@ -286,12 +776,109 @@ class TestErrorHandling:
             Mock(),  # No web attribute at all
         ]
         
-        with patch('server.validate_url', return_value=True):
+        with patch('server.validate_urls', return_value=[True, False, False]) as mock_validate:
             citations = resolve_urls(mock_chunks, 1)
             
+            assert mock_validate.call_count == 1  # One batched call for all chunks
+            
             # Should only process valid chunks
             assert len(citations) == 1
             assert citations[0].url == "https://valid.com"
+    
+    def test_resolve_urls_with_genai_types(self):
+        """Test real grounding chunk objects, whose web sources have no snippet field."""
+        from google.genai import types as genai_types
+        chunks = [
+            genai_types.GroundingChunk(
+                web=genai_types.GroundingChunkWeb(uri="https://a.com", title="A")
+            ),
+            genai_types.GroundingChunk(web=None),
+            genai_types.GroundingChunk(web=genai_types.GroundingChunkWeb(uri="https://c.com")),
+        ]
+        
+        citations = resolve_urls(chunks, 4)
+        
+        assert [(c.url, c.short_url, c.title) for c in citations] == [
+            ("https://a.com", "[4-0]", "A"),
+            ("https://c.com", "[4-2]", "Unknown Source"),
+        ]
+        assert citations[0].snippet is None
+    
+    def test_resolve_urls_cleans_titles(self):
+        """Test citation titles are normalized and non-web URLs are skipped."""
+        mock_chunks = [
+            Mock(web=Mock(uri="https://a.com", title="  Spaced \n  Title ", snippet=None)),
+            Mock(web=Mock(uri="https://b.com", title=None, snippet="Snippet")),
+            Mock(web=Mock(uri="https://c.com", title="x" * 150, snippet=None)),
+            Mock(web=Mock(uri="ftp://d.com", title="FTP", snippet=None)),
+        ]
+        
+        citations = resolve_urls(mock_chunks, 2)
+        
+        assert [c.short_url for c in citations] == ["[2-0]", "[2-1]", "[2-2]"]
+        assert citations[0].title == "Spaced Title"
+        assert citations[1].title == "Unknown Source"
+        assert citations[1].snippet == "Snippet"
+        assert len(citations[2].title) == 100
+        assert citations[2].title.endswith("...")
+    
+    @pytest.mark.asyncio
+    async def test_conduct_research_cleans_up_cancelled_session(self):
+        """Test a cancelled research run is removed from the active sessions."""
+        with patch('server.generate_search_queries', side_effect=asyncio.CancelledError()):
+            with pytest.raises(asyncio.CancelledError):
+                await conduct_research("test topic", "low")
+        
+        assert active_research_sessions == {}
+    
+    @pytest.mark.asyncio
+    async def test_conduct_research_releases_completed_session(self):
+        """Test a finished research run leaves no session behind."""
+        reflection = ResearchReflection(
+            is_sufficient=True, knowledge_gap="", follow_up_queries=[], confidence_score=0.9
+        )
+        with patch('server.generate_search_queries', new=AsyncMock(return_value=SearchQueryList(
+                 queries=[SearchQuery(query="q", rationale="r")], rationale="r"))), \
+             patch('server.run_search_batch', new=AsyncMock()), \
+             patch('server.reflect_on_research', new=AsyncMock(return_value=reflection)), \
+             patch('server.finalize_research_answer', new=AsyncMock(return_value="Report")):
+            assert await conduct_research("test topic", "low") == "Report"
+        
+        assert active_research_sessions == {}
+    
+    @pytest.mark.asyncio
+    async def test_conduct_research_stops_when_follow_ups_repeat(self):
+        """Test reflection is not repeated once every follow-up query was already searched."""
+        reflection = ResearchReflection(
+            is_sufficient=False, knowledge_gap="gap", follow_up_queries=["Q"], confidence_score=0.1
+        )
+        search_result = SearchResult(
+            content="c", citations=CitationBlock(), query_used="q", search_id=0
+        )
+        mock_reflect = AsyncMock(return_value=reflection)
+        with patch('server.generate_search_queries', new=AsyncMock(return_value=SearchQueryList(
+                 queries=[SearchQuery(query="q", rationale="r")], rationale="r"))), \
+             patch('server.perform_web_search', new=AsyncMock(return_value=search_result)), \
+             patch('server.reflect_on_research', new=mock_reflect), \
+             patch('server.finalize_research_answer', new=AsyncMock(return_value="Report")):
+            assert await conduct_research("test topic", "medium") == "Report"
+        
+        assert mock_reflect.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_http_client_survives_sessions_and_closes_at_exit(self):
+        """Test the shared pool is not tied to per-session lifespans and is closed at exit."""
+        with patch('server._http_client') as mock_http_client:
+            mock_http_client.aclose = AsyncMock()
+            
+            # Each client session enters the FastMCP lifespan; none may close the pool
+            for _ in range(2):
+                async with mcp._mcp_server.lifespan(mcp._mcp_server):
+                    pass
+            mock_http_client.aclose.assert_not_awaited()
+            
+            await close_http_client()
+            mock_http_client.aclose.assert_awaited_once()
 
 
 class TestIntegration:
@@ -316,7 +903,7 @@ class TestIntegration:
             # Mock search results
             mock_search.return_value = SearchResult(
                 content="Test search result",
-                citations=[],
+                citations=CitationBlock(),
                 query_used="test query",
                 search_id=1
             )